@@ -0,0 +1,2 @@
+# SPDX-FileCopyRightText: Copyright (c) 2022-present Jeffrey LeBlanc
+# SPDX-License-Indentifier: MIT
@@ -0,0 +1,86 @@
+# SPDX-FileCopyRightText: Copyright (c) 2022-present Jeffrey LeBlanc
+# SPDX-License-Indentifier: MIT
+
+"""
+Usage (from the repository root):
+
+    python -m bench list
+    python -m bench run [-k SUBSTR ...] [-o results.json]
+    python -m bench compare BASELINE.json NEW.json [--threshold 0.10] [--stat median]
+
+`run` exits with status 1 when any benchmark failed or is over its budget,
+`compare` when any benchmark failed, regressed past the threshold or is over budget.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Allow running from a checkout without installing jutil
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from . import harness
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m bench", description="jutil benchmark suite")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("list", help="list the available benchmarks")
+
+    p_run = sub.add_parser("run", help="run benchmarks")
+    p_run.add_argument("-k", dest="select", action="append", help="only run benchmarks whose name contains SUBSTR")
+    p_run.add_argument("-o", "--output", help="write results as a JSON baseline")
+    p_run.add_argument("--repeat", type=int, help="override the number of samples per benchmark")
+    p_run.add_argument("--min-time", type=float, help="override the minimum time per sample (seconds)")
+
+    p_cmp = sub.add_parser("compare", help="compare two result files")
+    p_cmp.add_argument("baseline")
+    p_cmp.add_argument("new")
+    p_cmp.add_argument("--threshold", type=float, default=0.10, help="allowed slowdown fraction (default 0.10)")
+    p_cmp.add_argument("--stat", choices=("median","min","mean"), default="median", help="statistic to compare (default median)")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "list":
+        for name,spec in sorted(harness.discover().items()):
+            print(name)
+        return 0
+
+    if args.command == "run":
+        results = harness.run_all(select=args.select, repeat=args.repeat, min_time=args.min_time)
+        if args.output:
+            harness.save(results, args.output)
+            print(f"-> saved {len(results)} results to {args.output}")
+        rc = 0
+        failed = [ r["name"] for r in results.values() if "failed" in r ]
+        if failed:
+            print(f"\n{len(failed)} benchmark(s) failed: {', '.join(failed)}")
+            rc = 1
+        over = [ r["name"] for r in results.values() if r.get("over_budget") ]
+        if over:
+            print(f"\n{len(over)} benchmark(s) over budget: {', '.join(over)}")
+            rc = 1
+        return rc
+
+    if args.command == "compare":
+        rows = harness.compare(harness.load(args.baseline), harness.load(args.new), threshold=args.threshold, stat=args.stat)
+        print(harness.format_comparison(rows))
+        rc = 0
+        failed = [ r for r in rows if r[4] == "FAILED" ]
+        if failed:
+            print(f"\n{len(failed)} benchmark(s) failed")
+            rc = 1
+        regressions = [ r for r in rows if r[4] == "REGRESSION" ]
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}")
+            rc = 1
+        over = [ r for r in rows if r[4] == "OVER BUDGET" ]
+        if over:
+            print(f"\n{len(over)} benchmark(s) over budget")
+            rc = 1
+        return rc
+
+
+if __name__ == "__main__":
+    sys.exit(main())
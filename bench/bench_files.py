@@ -0,0 +1,31 @@
+# SPDX-FileCopyRightText: Copyright (c) 2022-present Jeffrey LeBlanc
+# SPDX-License-Indentifier: MIT
+
+from jutil.filetools import empty_directory, filetree
+from jutil.v0.utils.files import merge_files
+from .harness import benchmark, Case
+from .standins import make_tree, require_binary
+
+
+@benchmark("files.empty_directory", repeat=5)
+def _(tmp):
+    root = tmp/"tree"
+    yield Case(lambda: empty_directory(root), prepare=lambda: make_tree(root, depth=3, fanout=4))
+
+@benchmark("files.filetree", repeat=5)
+def _(tmp):
+    require_binary("tree")
+    root = tmp/"tree"
+    make_tree(root, depth=3, fanout=4)
+    yield lambda: filetree(root)
+
+@benchmark("files.merge_files", repeat=5)
+def _(tmp):
+    size = 256*1024
+    sources = []
+    for i in range(64):
+        fn = tmp/f"part{i:02d}.txt"
+        fn.write_text(("line of text %d\n" % i) * ( size // 16 ))
+        sources.append(fn)
+    total = sum( fn.stat().st_size for fn in sources )
+    yield Case(lambda: merge_files(sources, tmp/"merged.txt"), units=total, unit_name="B")
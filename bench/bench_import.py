@@ -0,0 +1,57 @@
+# SPDX-FileCopyRightText: Copyright (c) 2022-present Jeffrey LeBlanc
+# SPDX-License-Indentifier: MIT
+
+"""
+Cold-start import cost, measured with `python -X importtime` in a fresh interpreter.
+Only the cumulative time of the top level `jutil*` imports is counted, not
+interpreter startup. Also fails if an optional backend is pulled in eagerly,
+stdlib cost is bounded by the per statement budgets.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+from .harness import benchmark, Case
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Optional backends that must only load on first use
+HEAVY = ("paramiko","libvirt","sh")
+
+
+def importtime(statement):
+    r = subprocess.run(
+        [sys.executable,"-X","importtime","-c",statement],
+        capture_output=True, cwd=REPO_ROOT, check=True, text=True
+    )
+    total_us = 0
+    loaded = set()
+    for line in r.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line.split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        name = parts[2]
+        pkg = name.strip()
+        loaded.add(pkg)
+        depth = len(name) - len(name.lstrip())
+        if depth == 1 and pkg.split(".")[0] == "jutil":
+            total_us += int(parts[1])
+    heavy = sorted( m for m in loaded if m.split(".")[0] in HEAVY )
+    if heavy:
+        raise AssertionError(f"{statement!r} imported heavy modules: {', '.join(heavy)}")
+    return total_us / 1e6
+
+def _register(name, statement, budget):
+    @benchmark(f"import.{name}", repeat=9, budget=budget)
+    def _(tmp):
+        yield Case(lambda: importtime(statement), self_timed=True)
+
+_register("jutil", "import jutil", 0.005)
+_register("jutil_proc", "import jutil.proc", 0.050)
+_register("jutil_filetools", "import jutil.filetools", 0.050)
+_register("jutil_sshconn", "import jutil.sshconn", 0.050)
+_register("jutil_v0_ssh", "import jutil.v0.utils.ssh", 0.050)
+_register("jutil_v0_libvirt", "import jutil.v0.libvirt.helpers, jutil.v0.libvirt.interface", 0.050)
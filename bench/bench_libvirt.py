@@ -0,0 +1,33 @@
+# SPDX-FileCopyRightText: Copyright (c) 2022-present Jeffrey LeBlanc
+# SPDX-License-Indentifier: MIT
+
+from .harness import benchmark
+from .standins import require_module
+
+URI = "test:///default"
+
+
+def _interface():
+    require_module("libvirt")
+    from jutil.v0.libvirt.interface import LibvirtSimInterface
+    return LibvirtSimInterface(sim_prefix="test", uri=URI)
+
+@benchmark("libvirt.connect")
+def _(tmp):
+    require_module("libvirt")
+    from jutil.v0.libvirt.interface import LibvirtSimInterface
+    def connect_close():
+        LibvirtSimInterface(sim_prefix="test", uri=URI).close()
+    yield connect_close
+
+@benchmark("libvirt.get_domain_statuses")
+def _(tmp):
+    iface = _interface()
+    yield iface.get_domain_statuses
+    iface.close()
+
+@benchmark("libvirt.get_network_information")
+def _(tmp):
+    iface = _interface()
+    yield iface.get_network_information
+    iface.close()
@@ -0,0 +1,23 @@
+# SPDX-FileCopyRightText: Copyright (c) 2022-present Jeffrey LeBlanc
+# SPDX-License-Indentifier: MIT
+
+from jutil.pkigen import PKIGenerator
+from .harness import benchmark, Case
+from .standins import require_binary
+
+
+@benchmark("pki.generate_site_ca", repeat=5, min_time=0)
+def _(tmp):
+    require_binary("openssl")
+    gen = PKIGenerator(tmp)
+    def prepare():
+        for f in tmp.iterdir():
+            f.unlink()
+    yield Case(gen.generate_site_ca, prepare=prepare)
+
+@benchmark("pki.generate_host_cert", repeat=5, min_time=0)
+def _(tmp):
+    require_binary("openssl")
+    gen = PKIGenerator(tmp)
+    gen.generate_site_ca()
+    yield lambda: gen.generate_host_cert("bench.example.com", force=True)
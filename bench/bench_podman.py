@@ -0,0 +1,37 @@
+# SPDX-FileCopyRightText: Copyright (c) 2022-present Jeffrey LeBlanc
+# SPDX-License-Indentifier: MIT
+
+from jutil.podman import podman_ps, podman_stop
+from .harness import benchmark
+from .standins import fake_podman
+
+
+@benchmark("podman.ps_5000", repeat=5)
+def _(tmp):
+    with fake_podman(tmp, count=5000):
+        yield lambda: podman_ps()
+
+@benchmark("podman.ps_5000_prefix", repeat=5)
+def _(tmp):
+    with fake_podman(tmp, count=5000, prefix="bench"):
+        yield lambda: podman_ps(prefix="bench-")
+
+@benchmark("podman.ps_5000_prefix_1pct", repeat=5)
+def _(tmp):
+    with fake_podman(tmp, count=5000, prefix="bench", match_every=100):
+        yield lambda: podman_ps(prefix="bench-")
+
+@benchmark("podman.ps_5000_raw", repeat=5)
+def _(tmp):
+    with fake_podman(tmp, count=5000):
+        yield lambda: podman_ps(raw=True)
+
+@benchmark("podman.ps_5000_obj_access", repeat=5)
+def _(tmp):
+    with fake_podman(tmp, count=5000):
+        yield lambda: [ c.obj["Id"] for c in podman_ps(prefix="bench-") ]
+
+@benchmark("podman.stop_prefix_parallel", repeat=3, min_time=0)
+def _(tmp):
+    with fake_podman(tmp, count=400):
+        yield lambda: podman_stop("bench-", parallel=8)
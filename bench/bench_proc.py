@@ -0,0 +1,35 @@
+# SPDX-FileCopyRightText: Copyright (c) 2022-present Jeffrey LeBlanc
+# SPDX-License-Indentifier: MIT
+
+from jutil.proc import proc, proc0, command_pretty_format
+from .harness import benchmark
+from .standins import require_binary
+
+
+@benchmark("proc.proc_spawn")
+def _(tmp):
+    true = require_binary("true")
+    yield lambda: proc([true])
+
+@benchmark("proc.proc_spawn_str")
+def _(tmp):
+    require_binary("true")
+    yield lambda: proc("true")
+
+@benchmark("proc.proc0_spawn")
+def _(tmp):
+    true = require_binary("true")
+    yield lambda: proc0([true])
+
+@benchmark("proc.proc0_output_1mb")
+def _(tmp):
+    require_binary("head")
+    yield lambda: proc0(["head","-c","1048576","/dev/zero"])
+
+@benchmark("proc.command_pretty_format")
+def _(tmp):
+    cmd = ["podman","run"]
+    for i in range(100):
+        cmd += [f"--volume", f"/srv/data/{i}:/data/{i}:Z", "--rm" if i % 5 == 0 else f"-p{i}"]
+    cmd += ["docker.io/library/alpine:latest","sleep","infinity"]
+    yield lambda: command_pretty_format(cmd)
@@ -0,0 +1,33 @@
+# SPDX-FileCopyRightText: Copyright (c) 2022-present Jeffrey LeBlanc
+# SPDX-License-Indentifier: MIT
+
+from .harness import benchmark, Case
+from .standins import paramiko_server, require_module
+
+
+def _connected(host, port, username, password):
+    paramiko = require_module("paramiko")
+    from jutil.sshconn import SSHConn
+    conn = SSHConn(address=host, username=username)
+    # SSHConn.connect() only does agent/key auth, so attach a password-authed client directly
+    client = paramiko.client.SSHClient()
+    client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+    client.connect(host, port=port, username=username, password=password,
+        allow_agent=False, look_for_keys=False)
+    conn._client = client
+    return conn
+
+@benchmark("ssh.exec_small", repeat=5)
+def _(tmp):
+    with paramiko_server() as server:
+        conn = _connected(*server)
+        yield lambda: conn.exec("echo hello")
+        conn.disconnect()
+
+@benchmark("ssh.exec_1mb", repeat=5)
+def _(tmp):
+    payload = b"x"*(1024*1024)
+    with paramiko_server(payload=payload) as server:
+        conn = _connected(*server)
+        yield Case(lambda: conn.exec("cat big"), units=len(payload), unit_name="B")
+        conn.disconnect()
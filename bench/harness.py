@@ -0,0 +1,250 @@
+# SPDX-FileCopyRightText: Copyright (c) 2022-present Jeffrey LeBlanc
+# SPDX-License-Indentifier: MIT
+
+"""
+Minimal benchmark harness
+
+A benchmark is a generator function registered with `@benchmark`. It receives
+a scratch directory, does its setup, yields either a callable or a `Case`,
+then does any teardown after the yield:
+
+    @benchmark("proc.spawn")
+    def _(tmp):
+        yield lambda: proc(["true"])
+
+Raise `Skip` during setup when a stand-in or dependency is missing. Any other
+exception is recorded as a failed result and the remaining benchmarks still run.
+A `budget` (seconds) on `@benchmark` marks results above it as over budget.
+"""
+
+import contextlib
+import importlib
+import io
+import json
+import pkgutil
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REGISTRY = {}
+
+
+class Skip(Exception):
+    pass
+
+
+class Case:
+
+    def __init__(self, fn, *, prepare=None, units=None, unit_name=None, self_timed=False):
+        """
+        fn: the timed callable
+        prepare: untimed callable run before every call of fn (forces one call per sample)
+        units/unit_name: work done per call, to report throughput (ie bytes)
+        self_timed: fn measures itself and returns seconds (forces one call per sample)
+        """
+        self.fn = fn
+        self.prepare = prepare
+        self.self_timed = self_timed
+        self.units = units
+        self.unit_name = unit_name
+
+
+def benchmark(name, *, repeat=7, min_time=0.1, group=None, budget=None):
+    def deco(fn):
+        if name in REGISTRY:
+            raise ValueError(f"Duplicate benchmark name: {name}")
+        REGISTRY[name] = dict(
+            name = name,
+            fn = fn,
+            repeat = repeat,
+            min_time = min_time,
+            budget = budget,
+            group = group or name.split(".")[0]
+        )
+        return fn
+    return deco
+
+
+def discover():
+    here = Path(__file__).parent
+    for info in pkgutil.iter_modules([str(here)]):
+        if info.name.startswith("bench_"):
+            importlib.import_module(f"{__package__}.{info.name}")
+    return REGISTRY
+
+
+#-- Running ------------------------------------------------------#
+
+def _calibrate(case, min_time):
+    if case.prepare is not None or case.self_timed:
+        return 1
+    number = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(number):
+            case.fn()
+        dt = time.perf_counter() - t0
+        if dt >= min_time or number >= 1_000_000:
+            return number
+        number *= 10 if dt < min_time/10 else 2
+
+def _sample(case, number):
+    if case.self_timed:
+        if case.prepare is not None:
+            case.prepare()
+        return case.fn()
+    if case.prepare is not None:
+        case.prepare()
+        t0 = time.perf_counter()
+        case.fn()
+        return time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for _ in range(number):
+        case.fn()
+    return ( time.perf_counter() - t0 ) / number
+
+def run_one(spec, *, repeat=None, min_time=None):
+    try:
+        return _run_one(spec, repeat=repeat, min_time=min_time)
+    except Exception as err:
+        return dict(name=spec["name"], group=spec["group"], failed=f"{type(err).__name__}: {err}")
+
+def _run_one(spec, *, repeat=None, min_time=None):
+    repeat = repeat or spec["repeat"]
+    min_time = spec["min_time"] if min_time is None else min_time
+    with tempfile.TemporaryDirectory(prefix="jutil-bench-") as tmp:
+        gen = spec["fn"](Path(tmp))
+        try:
+            case = next(gen)
+        except Skip as err:
+            return dict(name=spec["name"], group=spec["group"], skipped=str(err))
+        if not isinstance(case, Case):
+            case = Case(case)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                number = _calibrate(case, min_time)
+                times = [ _sample(case, number) for _ in range(repeat) ]
+        finally:
+            with contextlib.suppress(StopIteration):
+                next(gen)
+
+    result = dict(
+        name = spec["name"],
+        group = spec["group"],
+        repeat = repeat,
+        number = number,
+        min = min(times),
+        median = statistics.median(times),
+        mean = statistics.fmean(times),
+        stdev = statistics.stdev(times) if len(times) > 1 else 0.0,
+    )
+    if spec["budget"] is not None:
+        result["budget"] = spec["budget"]
+        result["over_budget"] = result["median"] > spec["budget"]
+    if case.units:
+        result["throughput"] = case.units / result["median"]
+        result["unit_name"] = case.unit_name
+    return result
+
+def run_all(*, select=None, repeat=None, min_time=None, log=print):
+    results = {}
+    for name,spec in sorted(discover().items()):
+        if select and not any( s in name for s in select ):
+            continue
+        r = run_one(spec, repeat=repeat, min_time=min_time)
+        log(format_result(r))
+        results[name] = r
+    return results
+
+
+#-- Baselines ------------------------------------------------------#
+
+def metadata():
+    from jutil import __version__
+    return dict(
+        jutil_version = __version__,
+        python = sys.version.split()[0],
+        implementation = platform.python_implementation(),
+        platform = platform.platform(),
+        machine = platform.machine(),
+        timestamp = time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    )
+
+def save(results, path):
+    Path(path).write_text(json.dumps(dict(meta=metadata(),results=results), indent=2)+"\n")
+
+def load(path):
+    return json.loads(Path(path).read_text())
+
+def compare(base, new, *, threshold=0.10, stat="median"):
+    """
+    Returns a list of rows (name, base_value, new_value, ratio, status) for `stat`
+    where status is one of "ok", "REGRESSION", "OVER BUDGET", "improved", "new", "missing" or "skipped".
+    A benchmark that failed in the new results is reported as "FAILED", one that only
+    failed in the baseline as "base failed". A zero baseline gives no ratio ("zero baseline").
+    """
+    rows = []
+    b_res,n_res = base["results"],new["results"]
+    for name in sorted(set(b_res)|set(n_res)):
+        b,n = b_res.get(name),n_res.get(name)
+        if n is not None and "failed" in n:
+            rows.append((name,None if b is None else b.get(stat),None,None,"FAILED"))
+        elif b is None:
+            rows.append((name,None,n.get(stat),None,"new"))
+        elif n is None:
+            rows.append((name,b.get(stat),None,None,"missing"))
+        elif "failed" in b:
+            rows.append((name,None,n.get(stat),None,"base failed"))
+        elif "skipped" in b or "skipped" in n:
+            rows.append((name,b.get(stat),n.get(stat),None,"skipped"))
+        else:
+            ratio = n[stat] / b[stat] if b[stat] else None
+            if n.get("budget") is not None and n[stat] > n["budget"]:
+                status = "OVER BUDGET"
+            elif ratio is None:
+                status = "zero baseline"
+            elif ratio > 1+threshold:
+                status = "REGRESSION"
+            elif ratio < 1/(1+threshold):
+                status = "improved"
+            else:
+                status = "ok"
+            rows.append((name,b[stat],n[stat],ratio,status))
+    return rows
+
+
+#-- Formatting ------------------------------------------------------#
+
+def fmt_time(sec):
+    if sec is None:
+        return "-"
+    for unit,scale in (("s",1),("ms",1e-3),("us",1e-6)):
+        if sec >= scale:
+            return f"{sec/scale:.3f}{unit}"
+    return f"{sec/1e-9:.1f}ns"
+
+def format_result(r):
+    if "skipped" in r:
+        return f"{r['name']:<40} SKIPPED ({r['skipped']})"
+    if "failed" in r:
+        return f"{r['name']:<40} FAILED ({r['failed']})"
+    s = (
+        f"{r['name']:<40} median {fmt_time(r['median']):>10}"
+        f"  min {fmt_time(r['min']):>10}  +/- {fmt_time(r['stdev']):>10}"
+        f"  ({r['repeat']}x{r['number']})"
+    )
+    if "throughput" in r:
+        s += f"  {r['throughput']/1e6:.1f} M{r['unit_name']}/s"
+    if r.get("over_budget"):
+        s += f"  OVER BUDGET ({fmt_time(r['budget'])})"
+    return s
+
+def format_comparison(rows):
+    lines = [f"{'benchmark':<40} {'base':>10} {'new':>10} {'ratio':>7}  status"]
+    for name,b,n,ratio,status in rows:
+        r = "-" if ratio is None else f"{ratio:.2f}x"
+        lines.append(f"{name:<40} {fmt_time(b):>10} {fmt_time(n):>10} {r:>7}  {status}")
+    return "\n".join(lines)
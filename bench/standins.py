@@ -0,0 +1,208 @@
+# SPDX-FileCopyRightText: Copyright (c) 2022-present Jeffrey LeBlanc
+# SPDX-License-Indentifier: MIT
+
+"""
+Local stand-ins for the external systems jutil talks to
+"""
+
+import contextlib
+import json
+import os
+import shutil
+import socket
+import sys
+import threading
+from pathlib import Path
+
+from .harness import Skip
+
+
+def require_binary(name):
+    path = shutil.which(name)
+    if path is None:
+        raise Skip(f"{name} not found on PATH")
+    return path
+
+def require_module(name):
+    try:
+        return __import__(name)
+    except ImportError:
+        raise Skip(f"python module {name} not installed")
+
+
+#-- Fake podman ------------------------------------------------------#
+
+def fake_container(i, prefix="bench", match_every=2):
+    name = f"{prefix}-{i:05d}" if i % match_every == 0 else f"other-{i:05d}"
+    return {
+        "AutoRemove": False,
+        "Command": ["/bin/sh","-c","sleep infinity"],
+        "CreatedAt": "3 days ago",
+        "Exited": bool(i % 3 == 0),
+        "ExitedAt": 1700000000 + i,
+        "ExitCode": 0,
+        "Id": f"{i:064x}",
+        "Image": "docker.io/library/alpine:latest",
+        "ImageID": "a"*64,
+        "IsInfra": False,
+        "Labels": { f"label{j}": f"value-{i}-{j}" for j in range(8) },
+        "Mounts": [f"/srv/data/{i}"],
+        "Names": [name],
+        "Namespaces": {},
+        "Networks": ["podman"],
+        "Pid": 1000 + i,
+        "Pod": "",
+        "PodName": "",
+        "Ports": [ {"host_ip":"","container_port":80,"host_port":10000+i,"range":1,"protocol":"tcp"} ],
+        "Size": None,
+        "StartedAt": 1700000000 + i,
+        "State": "exited" if i % 3 == 0 else "running",
+        "Status": "Up 3 days",
+        "Created": 1700000000 + i,
+    }
+
+# Applies a `--filter=name=REGEX` like podman does (regex search on any name)
+_FILTER_SCRIPT = """\
+import json, re, sys
+payload, regex, out = sys.argv[1:]
+rx = re.compile(regex)
+with open(payload) as f:
+    containers = [ c for c in json.load(f) if any( rx.search(n) for n in c["Names"] ) ]
+with open(out, "w") as f:
+    json.dump(containers, f, indent=4)
+"""
+
+@contextlib.contextmanager
+def fake_podman(tmp, count=5000, prefix="bench", match_every=2, fail_ps=False, fail_names=()):
+    """
+    Puts a `podman` on PATH that prints `count` containers as `podman ps --format=json` would,
+    one in `match_every` named `<prefix>-NNNNN`. `--filter=name=REGEX` is applied (and the
+    filtered output cached per regex, so only jutil's side is timed on repeat calls).
+    Any other subcommand (start, stop, rm...) echoes its last argument like podman does,
+    or fails with code 125 if that name is in `fail_names`. `fail_ps` makes `ps` fail.
+    Every invocation's arguments are appended to `calls.log`, whose path is yielded.
+    """
+    bindir = Path(tmp)/"fakebin"
+    bindir.mkdir(exist_ok=True)
+    payload = bindir/"ps.json"
+    payload.write_text(json.dumps([ fake_container(i,prefix,match_every) for i in range(count) ], indent=4))
+    filter_script = bindir/"filter.py"
+    filter_script.write_text(_FILTER_SCRIPT)
+    calls = bindir/"calls.log"
+    calls.touch()
+    fail_ps_line = 'echo "Error: unable to connect to Podman socket" >&2; exit 125\n' if fail_ps else ""
+    script = bindir/"podman"
+    script.write_text(
+        "#!/bin/sh\n"
+        f"echo \"$*\" >> '{calls}'\n"
+        "if [ \"$1\" = ps ]; then\n"
+        f"    {fail_ps_line}"
+        "    for arg; do\n"
+        "        case \"$arg\" in --filter=name=*)\n"
+        "            regex=\"${arg#--filter=name=}\"\n"
+        f"            cache='{payload}'.$(printf '%s' \"$regex\" | tr -c 'A-Za-z0-9' _)\n"
+        f"            [ -f \"$cache\" ] || '{sys.executable}' '{filter_script}' '{payload}' \"$regex\" \"$cache\"\n"
+        "            exec cat \"$cache\";;\n"
+        "        esac\n"
+        "    done\n"
+        f"    exec cat '{payload}'\n"
+        "fi\n"
+        "for last; do :; done\n"
+        f"case ' {' '.join(fail_names)} ' in *\" $last \"*) echo \"Error: no container with name $last\" >&2; exit 125;; esac\n"
+        "echo \"$last\"\n"
+    )
+    script.chmod(0o755)
+    old_path = os.environ.get("PATH","")
+    os.environ["PATH"] = f"{bindir}{os.pathsep}{old_path}"
+    try:
+        yield calls
+    finally:
+        os.environ["PATH"] = old_path
+
+
+#-- Synthetic trees ------------------------------------------------------#
+
+def make_tree(root, *, depth=3, fanout=4, files_per_dir=8, file_size=256):
+    """
+    Builds a tree of fanout**depth leaf dirs, returns the number of files created
+    """
+    root = Path(root)
+    root.mkdir(parents=True, exist_ok=True)
+    blob = b"x"*file_size
+    count = 0
+    for i in range(files_per_dir):
+        (root/f"file{i}.txt").write_bytes(blob)
+        count += 1
+    if depth > 0:
+        for j in range(fanout):
+            count += make_tree(root/f"dir{j}", depth=depth-1, fanout=fanout,
+                files_per_dir=files_per_dir, file_size=file_size)
+    return count
+
+
+#-- Local paramiko server ------------------------------------------------------#
+
+@contextlib.contextmanager
+def paramiko_server(username="bench", password="bench", payload=b""):
+    """
+    Runs an in-process SSH server on localhost. Every exec request gets back
+    the command followed by `payload` on stdout, and exit status 0.
+    Yields (host, port, username, password).
+    """
+    paramiko = require_module("paramiko")
+    host_key = paramiko.RSAKey.generate(2048)
+
+    class Server(paramiko.ServerInterface):
+
+        def check_auth_password(self, u, p):
+            if (u,p) == (username,password):
+                return paramiko.AUTH_SUCCESSFUL
+            return paramiko.AUTH_FAILED
+
+        def get_allowed_auths(self, u):
+            return "password"
+
+        def check_channel_request(self, kind, chanid):
+            if kind == "session":
+                return paramiko.OPEN_SUCCEEDED
+            return paramiko.OPEN_FAILED_ADMINISTRATIVELY_PROHIBITED
+
+        def check_channel_exec_request(self, channel, command):
+            def respond():
+                channel.sendall(command + b"\n" + payload)
+                channel.send_exit_status(0)
+                channel.close()
+            threading.Thread(target=respond, daemon=True).start()
+            return True
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind(("127.0.0.1", 0))
+    sock.listen(8)
+    stop = threading.Event()
+    transports = []
+
+    def serve():
+        sock.settimeout(0.2)
+        while not stop.is_set():
+            try:
+                client, _ = sock.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            t = paramiko.Transport(client)
+            t.add_server_key(host_key)
+            t.start_server(server=Server())
+            transports.append(t)
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    try:
+        yield ("127.0.0.1", sock.getsockname()[1], username, password)
+    finally:
+        stop.set()
+        thread.join()
+        for t in transports:
+            t.close()
+        sock.close()
@@ -2,3 +2,39 @@
 # SPDX-License-Indentifier: MIT
 
 from .__version__ import __version__
+
+# Public API, loaded on first attribute access so `import jutil` stays cheap
+# and optional backends (paramiko, libvirt, sh) are only imported when used.
+_LAZY = {
+    # proc() itself is not exported here, the name belongs to the jutil.proc submodule
+    "proc0":                 ("jutil.proc", "proc0"),
+    "ProcError":             ("jutil.proc", "ProcError"),
+    "command_pretty_format": ("jutil.proc", "command_pretty_format"),
+    "empty_directory":       ("jutil.filetools", "empty_directory"),
+    "filetree":              ("jutil.filetools", "filetree"),
+    "podman_ps":             ("jutil.podman", "podman_ps"),
+    "podman_start":          ("jutil.podman", "podman_start"),
+    "podman_stop":           ("jutil.podman", "podman_stop"),
+    "podman_rm":             ("jutil.podman", "podman_rm"),
+    "ContainerReport":       ("jutil.podman", "ContainerReport"),
+    "PKIGenerator":          ("jutil.pkigen", "PKIGenerator"),
+    "SSHConn":               ("jutil.sshconn", "SSHConn"),
+    "MissingDependency":     ("jutil._optional", "MissingDependency"),
+    "instrument":            ("jutil.instrument", None),
+}
+
+__all__ = ["__version__", *_LAZY]
+
+def __getattr__(name):
+    try:
+        modname,attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module 'jutil' has no attribute {name!r}") from None
+    import importlib
+    mod = importlib.import_module(modname)
+    value = mod if attr is None else getattr(mod, attr)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
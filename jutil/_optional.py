@@ -0,0 +1,35 @@
+# SPDX-FileCopyRightText: Copyright (c) 2022-present Jeffrey LeBlanc
+# SPDX-License-Indentifier: MIT
+
+"""
+Deferred imports for optional backends (paramiko, libvirt, sh)
+
+These are only imported on first use so `import jutil` and the light modules
+stay cheap, and a missing backend only errors when it is actually needed.
+"""
+
+import importlib
+import sys
+
+# module name => package to install
+PACKAGES = {
+    "paramiko": "paramiko",
+    "libvirt": "libvirt-python",
+    "sh": "sh",
+}
+
+class MissingDependency(ImportError):
+    pass
+
+def require(name, feature):
+    mod = sys.modules.get(name)
+    if mod is not None:
+        return mod
+    try:
+        return importlib.import_module(name)
+    except ImportError as err:
+        raise MissingDependency(
+            f"{feature} requires the optional dependency '{name}' "
+            f"(pip install {PACKAGES.get(name,name)})",
+            name = name
+        ) from err
@@ -0,0 +1,228 @@
+# SPDX-FileCopyRightText: Copyright (c) 2022-present Jeffrey LeBlanc
+# SPDX-License-Indentifier: MIT
+
+"""
+Lightweight instrumentation for external calls (processes, ssh, libvirt...)
+
+Call sites do:
+
+    t0 = instrument.start()
+    ... do the work ...
+    instrument.record(t0, "proc", "openssl", target=..., code=...)
+
+When no hook is registered `start()` returns None and `record()` returns
+immediately, so the cost is a list check and a function call.
+
+Hooks are callables taking a single `CallEvent`.
+"""
+
+# This is imported by jutil.proc, so only cheap modules at import time:
+# dataclasses/json/logging/threading together add ~25-35ms, which would put
+# `import jutil.proc` at or over its import budget (bench/bench_import.py)
+from collections import deque
+import functools
+import time
+
+_HOOKS = []
+
+
+class CallEvent:
+    # Plain __slots__ class rather than a dataclass, see the import note above
+    __slots__ = ("kind","op","target","duration","bytes_in","bytes_out","code","error")
+
+    def __init__(self, kind, op, target=None, duration=0.0, bytes_in=None, bytes_out=None, code=None, error=None):
+        self.kind = kind
+        self.op = op
+        self.target = target
+        self.duration = duration
+        self.bytes_in = bytes_in
+        self.bytes_out = bytes_out
+        self.code = code
+        self.error = error
+
+    def __repr__(self):
+        fields = ", ".join( f"{k}={getattr(self,k)!r}" for k in self.__slots__ )
+        return f"CallEvent({fields})"
+
+    def as_dict(self):
+        return { k:getattr(self,k) for k in self.__slots__ }
+
+
+#-- Hook Registration ------------------------------------------------------#
+
+def add_hook(hook):
+    if hook not in _HOOKS:
+        _HOOKS.append(hook)
+    return hook
+
+def remove_hook(hook):
+    if hook in _HOOKS:
+        _HOOKS.remove(hook)
+
+def clear_hooks():
+    _HOOKS.clear()
+
+def enabled():
+    return bool(_HOOKS)
+
+
+#-- Recording ------------------------------------------------------#
+
+def start():
+    return time.perf_counter() if _HOOKS else None
+
+def record(t0, kind, op, *, target=None, bytes_in=None, bytes_out=None, code=None, error=None):
+    if t0 is None or not _HOOKS:
+        return
+    event = CallEvent(
+        kind = kind,
+        op = op,
+        target = None if target is None else str(target),
+        duration = time.perf_counter() - t0,
+        bytes_in = bytes_in,
+        bytes_out = bytes_out,
+        code = code,
+        error = error
+    )
+    for hook in tuple(_HOOKS):
+        try:
+            hook(event)
+        except Exception:
+            import logging
+            logging.exception(f"instrument: hook {hook!r} failed")
+
+def traced(kind, op=None, target=None):
+    """
+    Method/function decorator recording one event per call.
+    `target` is an attribute name looked up on the first argument (ie self).
+    Exit status is 0 on return, None with `error` set on an exception.
+    """
+    def deco(fn):
+        _op = op or fn.__name__
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            t0 = start()
+            if t0 is None:
+                return fn(*args, **kwargs)
+            _target = getattr(args[0], target, None) if ( target and args ) else None
+            try:
+                r = fn(*args, **kwargs)
+            except BaseException as err:
+                record(t0, kind, _op, target=_target, error=repr(err))
+                raise
+            record(t0, kind, _op, target=_target, code=0)
+            return r
+        return wrapper
+    return deco
+
+
+#-- Built-in Hooks ------------------------------------------------------#
+
+# Upper bounds in seconds, a final +Inf bucket is implied
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+class LatencyHistogram:
+    """
+    Aggregates events into per (kind,op) latency histograms with byte and error totals.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        import threading
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._series = {}
+
+    def __call__(self, event):
+        key = (event.kind, event.op)
+        with self._lock:
+            s = self._series.get(key)
+            if s is None:
+                s = self._series[key] = {
+                    "counts": [0]*(len(self.buckets)+1),
+                    "count": 0,
+                    "sum": 0.0,
+                    "max": 0.0,
+                    "errors": 0,
+                    "bytes_in": 0,
+                    "bytes_out": 0,
+                }
+            i = 0
+            while i < len(self.buckets) and event.duration > self.buckets[i]:
+                i += 1
+            s["counts"][i] += 1
+            s["count"] += 1
+            s["sum"] += event.duration
+            s["max"] = max(s["max"], event.duration)
+            if event.error is not None or ( event.code is not None and event.code != 0 ):
+                s["errors"] += 1
+            s["bytes_in"] += event.bytes_in or 0
+            s["bytes_out"] += event.bytes_out or 0
+
+    def reset(self):
+        with self._lock:
+            self._series.clear()
+
+    def snapshot(self):
+        with self._lock:
+            out = []
+            for (kind,op),s in sorted(self._series.items()):
+                out.append(dict(
+                    kind = kind,
+                    op = op,
+                    buckets = [ [le,n] for le,n in zip(list(self.buckets)+["+Inf"],s["counts"]) ],
+                    **{ k:v for k,v in s.items() if k != "counts" }
+                ))
+            return out
+
+    def dump_json(self, **kwargs):
+        import json
+        return json.dumps(self.snapshot(), **kwargs)
+
+    def dump_prometheus(self, prefix="jutil_call"):
+        lines = [
+            f"# HELP {prefix}_duration_seconds Duration of external calls",
+            f"# TYPE {prefix}_duration_seconds histogram",
+        ]
+        totals = []
+        for s in self.snapshot():
+            labels = f'kind="{_esc(s["kind"])}",op="{_esc(s["op"])}"'
+            cumulative = 0
+            for le,n in s["buckets"]:
+                cumulative += n
+                lines.append(f'{prefix}_duration_seconds_bucket{{{labels},le="{le}"}} {cumulative}')
+            lines.append(f"{prefix}_duration_seconds_sum{{{labels}}} {s['sum']}")
+            lines.append(f"{prefix}_duration_seconds_count{{{labels}}} {s['count']}")
+            totals.append((labels,s))
+        for name,key in (("errors","errors"),("bytes_in","bytes_in"),("bytes_out","bytes_out")):
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            for labels,s in totals:
+                lines.append(f"{prefix}_{name}_total{{{labels}}} {s[key]}")
+        return "\n".join(lines)+"\n"
+
+def _esc(v):
+    return str(v).replace("\\","\\\\").replace('"','\\"').replace("\n","\\n")
+
+
+class SlowCallLog:
+    """
+    Keeps (and logs) the most recent events slower than `threshold` seconds.
+    """
+
+    def __init__(self, threshold=1.0, maxlen=256, logger=None):
+        self.threshold = threshold
+        self.entries = deque(maxlen=maxlen)
+        self.logger = logger
+
+    def __call__(self, event):
+        if event.duration < self.threshold:
+            return
+        self.entries.append(event)
+        if self.logger is not None:
+            self.logger.warning(
+                f"slow call {event.kind}:{event.op} target={event.target} "
+                f"{event.duration:.3f}s code={event.code}"
+            )
+
+    def dump_json(self, **kwargs):
+        import json
+        return json.dumps([ e.as_dict() for e in self.entries ], **kwargs)
@@ -2,6 +2,7 @@
 # SPDX-License-Indentifier: MIT
 
 from .proc import proc, proc0
+from . import instrument
 
 def host_cert_exts(host):
     return f"""basicConstraints=CA:FALSE
@@ -16,6 +17,7 @@ class PKIGenerator:
         assert pki_dir.is_dir()
         self.PKI_DIR = pki_dir
 
+    @instrument.traced("pki",target="PKI_DIR")
     def generate_site_ca(self, ca_name="Fake Root CA", numbits="2048", days=400):
         ca_key = self.PKI_DIR/"ca.key"
         ca_pem = self.PKI_DIR/"ca.pem"
@@ -41,6 +43,7 @@ class PKIGenerator:
             ])
 
 
+    @instrument.traced("pki",target="PKI_DIR")
     def generate_host_cert(self, hostname, adl_subj="", prefix="",numbits="2048",days=400,*,force=False):
         if prefix != "" and not prefix.endswith("_"):
             prefix = prefix+"_"
@@ -1,30 +1,184 @@
 # SPDX-FileCopyRightText: Copyright (c) 2022-present Jeffrey LeBlanc
 # SPDX-License-Indentifier: MIT
 
-from dataclasses import dataclass
-from .proc import proc
+from .proc import proc, proc0, ProcError
 import json
+import re
 
-@dataclass
 class ContainerReport:
-    name: str
-    on: bool
-    obj: dict
+    """
+    Compact container entry from `podman ps`.
+    Only `name` and `on` are read up front, the full podman dict is kept as its
+    JSON text and decoded once, on first access to `obj`.
+    """
+    __slots__ = ("name","on","_obj","_raw")
+
+    def __init__(self, name, on, obj=None, *, raw=None):
+        self.name = name
+        self.on = on
+        self._obj = obj
+        self._raw = raw
+
+    @property
+    def obj(self):
+        if self._raw is not None:
+            self._obj = json.loads(self._raw)
+            self._raw = None
+        return self._obj
+
+    def __repr__(self):
+        return f"ContainerReport(name={self.name!r}, on={self.on!r})"
+
+    def __eq__(self, other):
+        if not isinstance(other, ContainerReport):
+            return NotImplemented
+        return (self.name,self.on,self.obj) == (other.name,other.on,other.obj)
+
+
+#-- Parsing ------------------------------------------------------#
+
+_DECODER = json.JSONDecoder()
+_WS = re.compile(r"[ \t\n\r]*")
+_FIRST_ELEMENT = re.compile(r"[ \t\n\r]*\[\n([ \t]*)\{\n([ \t]*)\"")
+_STRING = r'"((?:[^"\\]|\\.)*)"'
+
+def _iter_json_array(text):
+    """
+    Yields each element of a top level JSON array, decoding one element at a time.
+    Raises ValueError on anything else, including empty text.
+    """
+    idx = _WS.match(text,0).end()
+    if not text.startswith("[",idx):
+        raise ValueError(f"Expected a JSON array at position {idx}")
+    idx = _WS.match(text,idx+1).end()
+    if text.startswith("]",idx):
+        return
+    while True:
+        obj,idx = _DECODER.raw_decode(text,idx)
+        yield obj
+        idx = _WS.match(text,idx).end()
+        ch = text[idx:idx+1]
+        if ch == "]":
+            return
+        if ch != ",":
+            raise ValueError(f"Expected ',' or ']' at position {idx}")
+        idx = _WS.match(text,idx+1).end()
+
+def _split_indented_array(text):
+    """
+    Splits a pretty printed array of objects (podman's output) into element texts
+    without decoding them. JSON strings can't hold a raw newline, so a newline plus
+    the element indent plus "}" can only close a top level element.
+    Returns (elements, key_indent), or None if the text isn't laid out that way.
+    """
+    m = _FIRST_ELEMENT.match(text)
+    if m is None:
+        return None
+    indent,key_indent = m.groups()
+    close = "\n"+indent+"}"
+    sep = ",\n"+indent+"{"
+    elements = []
+    start = text.index("{",m.start(1))
+    while True:
+        end = text.find(close,start)
+        if end == -1:
+            return None
+        end += len(close)
+        elements.append(text[start:end])
+        if text.startswith(sep,end):
+            start = end+len(sep)-1
+            continue
+        idx = _WS.match(text,end).end()
+        if text.startswith("]",idx) and _WS.match(text,idx+1).end() == len(text):
+            return elements,key_indent
+        return None
+
+def _iter_ps_entries(text):
+    """
+    Yields (name, on, obj, raw) per container; either obj or raw (the element's
+    JSON text, for lazy decoding) is set. Pretty printed output is split and only
+    Names/Exited are read with a regex; anything else is decoded element by element.
+    """
+    split = _split_indented_array(text)
+    if split is None:
+        for obj in _iter_json_array(text):
+            yield obj["Names"][0],not obj["Exited"],obj,None
+        return
+    elements,key_indent = split
+    # Only match keys at the element's own indentation, not in nested objects
+    k = re.escape(key_indent)
+    names_re = re.compile(rf'\n{k}"Names": \[\s*{_STRING}')
+    exited_re = re.compile(rf'\n{k}"Exited": (true|false)')
+    for raw in elements:
+        n,x = names_re.search(raw),exited_re.search(raw)
+        if n is None or x is None:
+            obj = json.loads(raw)
+            yield obj["Names"][0],not obj["Exited"],obj,None
+            continue
+        name = n.group(1)
+        if "\\" in name:
+            name = json.loads(f'"{name}"')
+        yield name,x.group(1) == "false",None,raw
 
 def podman_ps(*, prefix=None, _all=True, raw=False):
-    c,o,e = proc("podman ps --all --format=json")
-    raw_obj = json.loads(o)
+    cmd = ["podman","ps","--format=json"]
+    if _all:
+        cmd.append("--all")
+    if prefix and not raw:
+        # Let podman do the bulk of the filtering, the name filter is a regex
+        cmd.append(f"--filter=name=^{re.escape(prefix)}")
+    c,o,e = proc0(cmd,quiet=True)
+    if not o.strip():
+        raise ProcError(f"podman_ps: no output from {' '.join(cmd)}")
     if raw:
-        return raw_obj
+        return json.loads(o)
     else:
         containers = []
-        for c_dict in raw_obj:
-            name = c_dict["Names"][0]
+        for name,on,obj,raw_text in _iter_ps_entries(o):
             if prefix is not None and not name.startswith(prefix):
                 continue
-            on = not c_dict["Exited"]
-            c = ContainerReport(name=name,on=on,obj=c_dict)
-            containers.append(c)
+            containers.append(ContainerReport(name,on,obj,raw=raw_text))
         containers.sort(key=lambda e:e.name)
         return containers
 
+
+#-- Bulk Operations ------------------------------------------------------#
+
+def _bulk(op, names, args, parallel):
+    """
+    Runs `podman <op> <args> <name>` for every name, at most `parallel` at a time.
+    Returns {name: (code, stdout, stderr)} ordered by name.
+    """
+    names = sorted(names)
+    if not names:
+        return {}
+    def run(name):
+        return proc(["podman",op,*args,name])
+    if parallel <= 1 or len(names) == 1:
+        return { n:run(n) for n in names }
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=min(parallel,len(names))) as pool:
+        return dict(zip(names,pool.map(run,names)))
+
+def _check_prefix(prefix):
+    if not prefix:
+        raise ValueError("A non-empty container name prefix is required for bulk operations")
+
+def podman_start(prefix, *, parallel=8):
+    _check_prefix(prefix)
+    names = [ c.name for c in podman_ps(prefix=prefix) if not c.on ]
+    return _bulk("start",names,[],parallel)
+
+def podman_stop(prefix, *, parallel=8, timeout=None):
+    _check_prefix(prefix)
+    names = [ c.name for c in podman_ps(prefix=prefix) if c.on ]
+    args = [] if timeout is None else [f"--time={timeout}"]
+    return _bulk("stop",names,args,parallel)
+
+def podman_rm(prefix, *, parallel=8, force=False):
+    _check_prefix(prefix)
+    containers = podman_ps(prefix=prefix)
+    if not force:
+        containers = [ c for c in containers if not c.on ]
+    args = ["--force"] if force else []
+    return _bulk("rm",[ c.name for c in containers ],args,parallel)
@@ -3,14 +3,34 @@
 
 import subprocess
 import shlex
+import os
+from . import instrument
 
 class ProcError(Exception):
     pass
 
+def _run(cmd, cwd):
+    t0 = instrument.start()
+    if t0 is None:
+        return subprocess.run(cmd,capture_output=True,cwd=cwd)
+    op = os.path.basename(str(cmd[0])) if cmd else ""
+    try:
+        r = subprocess.run(cmd,capture_output=True,cwd=cwd)
+    except Exception as err:
+        instrument.record(t0,"proc",op,target=cwd,error=repr(err))
+        raise
+    instrument.record(t0,"proc",op,
+        target = cwd,
+        bytes_in = 0,
+        bytes_out = len(r.stdout)+len(r.stderr),
+        code = r.returncode
+    )
+    return r
+
 def proc(cmd, cwd=None):
     if isinstance(cmd,str):
         cmd = shlex.split(cmd)
-    r = subprocess.run(cmd,capture_output=True,cwd=cwd)
+    r = _run(cmd,cwd)
     return (
         r.returncode,
         r.stdout.decode("utf-8"),
@@ -20,7 +40,7 @@ def proc(cmd, cwd=None):
 def proc0(cmd, cwd=None, quiet=False):
     if isinstance(cmd,str):
         cmd = shlex.split(cmd)
-    r = subprocess.run(cmd,capture_output=True,cwd=cwd)
+    r = _run(cmd,cwd)
     if r.returncode != 0:
         if not quiet:
             print("---------------------------------------------")
@@ -1,7 +1,8 @@
 # SPDX-FileCopyRightText: Copyright (c) 2022-present Jeffrey LeBlanc
 # SPDX-License-Indentifier: MIT
 
-import paramiko
+from . import instrument
+from ._optional import require
 
 """
 https://docs.paramiko.org/en/stable/api/client.html
@@ -18,6 +19,7 @@ class SSHConn:
         """
         This method needs review, options, and error handling
         """
+        paramiko = require("paramiko","jutil.sshconn.SSHConn")
         self._client = paramiko.client.SSHClient()
         # => seems to not be picking up clients manually connected to?
         # demo.photon.ac for example
@@ -29,18 +31,31 @@ class SSHConn:
         self._client.close()
 
     def exec(self, command_string, as_dict=False):
-        _stdin,_stdout,_stderr = self._client.exec_command(command_string)
-        return_code = _stdout.channel.recv_exit_status()
+        t0 = instrument.start()
+        try:
+            _stdin,_stdout,_stderr = self._client.exec_command(command_string)
+            return_code = _stdout.channel.recv_exit_status()
+            stdout = _stdout.read()
+            stderr = _stderr.read()
+        except Exception as err:
+            instrument.record(t0,"ssh","exec",target=self.address,error=repr(err))
+            raise
+        if t0 is not None:
+            instrument.record(t0,"ssh","exec",
+                target = self.address,
+                bytes_in = len(command_string.encode("utf-8")),
+                bytes_out = len(stdout)+len(stderr),
+                code = return_code
+            )
         if as_dict:
             return {
                 "code": return_code,
-                "stdout": _stdout.read().decode("utf-8"),
-                "stderr": _stderr.read().decode("utf-8")
+                "stdout": stdout.decode("utf-8"),
+                "stderr": stderr.decode("utf-8")
             }
         else:
             return (
                 return_code,
-                _stdout.read().decode("utf-8"),
-                _stderr.read().decode("utf-8")
+                stdout.decode("utf-8"),
+                stderr.decode("utf-8")
             )
-
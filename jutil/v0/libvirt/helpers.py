@@ -1,8 +1,12 @@
 # SPDX-FileCopyRightText: Copyright (c) 2023-present Jeffrey LeBlanc
 # SPDX-License-Indentifier: MIT
 
-import libvirt
 from contextlib import contextmanager
+from ..._optional import require
+
+
+def _libvirt():
+    return require('libvirt','jutil.v0.libvirt')
 
 
 def can_user_control_libvirt(exit_if_not=False):
@@ -31,12 +35,20 @@ def can_user_control_libvirt(exit_if_not=False):
         return False
 
 
-IPTYPE = {
-    libvirt.VIR_IP_ADDR_TYPE_IPV4: "ipv4",
-    libvirt.VIR_IP_ADDR_TYPE_IPV6: "ipv6",
-}
+def __getattr__(name):
+    # IPTYPE needs libvirt constants, so build it on first access
+    if name == 'IPTYPE':
+        libvirt = _libvirt()
+        global IPTYPE
+        IPTYPE = {
+            libvirt.VIR_IP_ADDR_TYPE_IPV4: "ipv4",
+            libvirt.VIR_IP_ADDR_TYPE_IPV6: "ipv6",
+        }
+        return IPTYPE
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def _get_dom_ifaces(dom):
+    libvirt = _libvirt()
     ifaces = dom.interfaceAddresses(libvirt.VIR_DOMAIN_INTERFACE_ADDRESSES_SRC_LEASE)
     if ifaces is None:
         print("Failed to get domain interfaces")
@@ -57,6 +69,7 @@ def _extract_ipv4(ifaces):
 
 @contextmanager
 def libvirt_connection(uri='qemu:///system', quiet=False):
+    libvirt = _libvirt()
     try:
         conn = libvirt.open(uri)
     except libvirt.libvirtError:
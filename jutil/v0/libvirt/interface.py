@@ -1,8 +1,9 @@
 # SPDX-FileCopyRightText: Copyright (c) 2023-present Jeffrey LeBlanc
 # SPDX-License-Indentifier: MIT
 
-import libvirt
 from contextlib import contextmanager
+from ... import instrument
+from .helpers import _libvirt, _get_dom_ifaces, _extract_ipv4
 
 
 
@@ -32,8 +33,10 @@ class LibvirtSimInterface:
 
     #-- Connection Handling ------------------------------------------------------#
 
+    @instrument.traced('libvirt',target='uri')
     def connect(self):
         if not self.shared_conn and self.conn is None:
+            libvirt = _libvirt()
             try:
                 self.conn = libvirt.open(self.uri)
             except libvirt.libvirtError:
@@ -49,6 +52,7 @@ class LibvirtSimInterface:
 
     #-- Information Gathering ------------------------------------------------------#
 
+    @instrument.traced('libvirt',target='uri')
     def get_network_information(self):
         results = {
             'inactive':[],
@@ -71,6 +75,7 @@ class LibvirtSimInterface:
                 })
         return results
 
+    @instrument.traced('libvirt',target='uri')
     def get_domain_statuses(self):
         results = {
             'active': [],
@@ -92,11 +97,14 @@ class LibvirtSimInterface:
         return results
 
 
+    @instrument.traced('libvirt',target='uri')
     def get_active_network_info(self, include_ifaces=False):
         '''
         TODO: We will want to filter by sim prefix
         '''
 
+        libvirt = _libvirt()
+
         # Get the active domain ids
         active_domain_ids = self.conn.listDomainsID()
 
@@ -123,6 +131,7 @@ class LibvirtSimInterface:
 
     #-- Control ------------------------------------------------------#
 
+    @instrument.traced('libvirt',target='uri')
     def start_inactive_domains(self):
         for domain in self.conn.listAllDomains(0):
             domain_name = domain.name()
@@ -130,9 +139,12 @@ class LibvirtSimInterface:
                 is_active = domain.isActive()
                 if not domain.isActive():
                     print(f'starting {domain_name}...')
+                    t0 = instrument.start()
                     r = domain.create()
+                    instrument.record(t0,'libvirt','domain.create',target=domain_name,code=r)
                     print('result: ',r)
 
+    @instrument.traced('libvirt',target='uri')
     def shutdown_active_domains(self):
         for domain in self.conn.listAllDomains(0):
             domain_name = domain.name()
@@ -140,7 +152,9 @@ class LibvirtSimInterface:
                 is_active = domain.isActive()
                 if domain.isActive():
                     print(f'stopping {domain_name}...')
+                    t0 = instrument.start()
                     r = domain.shutdown()
+                    instrument.record(t0,'libvirt','domain.shutdown',target=domain_name,code=r)
                     print('result',r)
 
 
@@ -3,11 +3,30 @@
 
 import subprocess
 import shlex
+import os
+from ... import instrument
+
+def _run(cmd):
+    t0 = instrument.start()
+    if t0 is None:
+        return subprocess.run(cmd,capture_output=True)
+    op = os.path.basename(str(cmd[0])) if cmd else ''
+    try:
+        r = subprocess.run(cmd,capture_output=True)
+    except Exception as err:
+        instrument.record(t0,'proc',op,error=repr(err))
+        raise
+    instrument.record(t0,'proc',op,
+        bytes_in = 0,
+        bytes_out = len(r.stdout)+len(r.stderr),
+        code = r.returncode
+    )
+    return r
 
 def proc(cmd):
     if isinstance(cmd,str):
         cmd = shlex.split(cmd)
-    r = subprocess.run(cmd,capture_output=True)
+    r = _run(cmd)
     return (
         r.returncode,
         r.stdout.decode('utf-8'),
@@ -1,17 +1,30 @@
 # SPDX-FileCopyRightText: Copyright (c) 2023-present Jeffrey LeBlanc
 # SPDX-License-Indentifier: MIT
 
-import sh
 import re
 import os
-import asyncio
 import logging
+from ... import instrument
+from ..._optional import require
+
+
+def _sh():
+    return require('sh','jutil.v0.utils.ssh')
 
 
 def _get_permissions(fp):
     ''' Returns a integer '''
     return ( os.lstat(fp).st_mode & 0o777 )
 
+_RSYNC_STATS = re.compile(r'sent ([\d,.]+) bytes\s+received ([\d,.]+) bytes')
+
+def _rsync_bytes(stdout):
+    ''' Returns (sent,received) parsed from rsync -v output, or (None,None) '''
+    m = _RSYNC_STATS.search(stdout)
+    if m is None:
+        return None,None
+    return tuple( int(v.replace(',','').replace('.','')) for v in m.groups() )
+
 class SSHConn():
     '''
     Convenience class to encapsulate an SSH connection.
@@ -37,6 +50,7 @@ class SSHConn():
         self.master_socket_dir = os.path.join(os.environ['HOME'],'.ssh','sockets')
 
         # Setup and bake core call
+        sh = _sh()
         strhst = {} if strict_host else dict(o="StrictHostKeyChecking no")
         if self.using_master:
             self.setup_master_config()
@@ -68,7 +82,7 @@ class SSHConn():
             f'ControlPersist {self.master_timeout_sec}\n' # time to live in seconds
         )
         if not os.path.isfile(self.master_config_path):
-            sh.touch(self.master_config_path)
+            _sh().touch(self.master_config_path)
             os.chmod(self.master_config_path, 0o600)
             with open(self.master_config_path,'w') as f:
                 f.write(config_contents)
@@ -113,16 +127,21 @@ class SSHConn():
         return (o.strip() == 'Y')
 
     def sendraw(self, command_string):
+        sh = _sh()
+        t0 = instrument.start()
         try:
             resp = self.cli(command_string)
-            o = resp.stdout.decode('utf-8').strip()
-            e = resp.stderr.decode('utf-8').strip()
-            c = resp.exit_code
+            o,e,c = resp.stdout,resp.stderr,resp.exit_code
         except sh.ErrorReturnCode as err:
-            o = err.stdout.decode('utf-8').strip()
-            e = err.stderr.decode('utf-8').strip()
-            c = err.exit_code
-        return c,o,e
+            o,e,c = err.stdout,err.stderr,err.exit_code
+        if t0 is not None:
+            instrument.record(t0,'ssh','sendraw',
+                target = self.host,
+                bytes_in = len(command_string.encode('utf-8')),
+                bytes_out = len(o)+len(e),
+                code = c
+            )
+        return c,o.decode('utf-8').strip(),e.decode('utf-8').strip()
 
     #-- Sync Handling ------------------------------------------------------------------#
 
@@ -139,13 +158,28 @@ class SSHConn():
         if delete:
             cmdlst += ['--delete']
         cmdlst += [src, f'{self.user}@{self.host}:{dst}' ]
-        return sh.rsync(*cmdlst)
+        sh = _sh()
+        t0 = instrument.start()
+        try:
+            out = sh.rsync(*cmdlst)
+        except sh.ErrorReturnCode as err:
+            instrument.record(t0,'ssh','rsync',target=self.host,code=err.exit_code,error=repr(err))
+            raise
+        if t0 is not None:
+            sent,received = _rsync_bytes(out.stdout.decode('utf-8','replace'))
+            instrument.record(t0,'ssh','rsync',
+                target = self.host,
+                bytes_in = sent,
+                bytes_out = received,
+                code = out.exit_code
+            )
+        return out
 
     def scp(self, src, dst):
         cmd = [src,f'{self.user}@{self.host}:{dst}']
         if self.using_master:
             cmd = ['-F',self.master_config_path] + cmd
-        out = sh.scp(cmd)
+        out = _sh().scp(cmd)
 
     #-- TMUX Handling ------------------------------------------------------------------#
 
@@ -179,6 +213,8 @@ class SSHConn():
         return self.send(command)
 
     async def send_tmux_keys_seq(self, seq, wrap=True, delay=0.25):
+        # asyncio alone costs ~45ms to import, well over this module's import budget
+        import asyncio
         for cmd in seq:
             o,e = self.send_tmux_keys(cmd,wrap=wrap)
             await asyncio.sleep(delay)
@@ -0,0 +1,8 @@
+# SPDX-FileCopyRightText: Copyright (c) 2022-present Jeffrey LeBlanc
+# SPDX-License-Indentifier: MIT
+
+import sys
+from pathlib import Path
+
+# Run against the checkout (jutil and the bench stand-ins) without installing
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,73 @@
+# SPDX-FileCopyRightText: Copyright (c) 2022-present Jeffrey LeBlanc
+# SPDX-License-Indentifier: MIT
+
+from bench import harness
+from bench.__main__ import main
+
+
+def _res(**results):
+    return {"results": results}
+
+def _ok(median, **kw):
+    return dict(median=median, min=median, mean=median, **kw)
+
+def _status(rows):
+    return { name:status for name,_,_,_,status in rows }
+
+
+def test_compare_threshold():
+    base = _res(same=_ok(1.0), edge=_ok(1.0), slow=_ok(1.0), fast=_ok(1.0), fast_edge=_ok(1.0))
+    new = _res(same=_ok(1.0), edge=_ok(1.1), slow=_ok(1.11), fast=_ok(0.5), fast_edge=_ok(1/1.1))
+    rows = harness.compare(base, new, threshold=0.10)
+    assert _status(rows) == dict(same="ok", edge="ok", slow="REGRESSION", fast="improved", fast_edge="ok")
+    assert [ r[0] for r in rows ] == sorted(base["results"])
+    row = { r[0]:r for r in rows }["slow"]
+    assert row[1:4] == (1.0, 1.11, 1.11/1.0)
+
+def test_compare_stat():
+    base = _res(a=dict(median=1.0, min=1.0, mean=1.0))
+    new = _res(a=dict(median=1.0, min=2.0, mean=1.0))
+    assert _status(harness.compare(base, new)) == {"a":"ok"}
+    assert _status(harness.compare(base, new, stat="min")) == {"a":"REGRESSION"}
+
+def test_compare_missing_new_skipped_failed():
+    base = _res(gone=_ok(1.0), skip=dict(skipped="no tool"), bfail=dict(failed="OSError: x"), nfail=_ok(1.0))
+    new = _res(added=_ok(1.0), skip=_ok(1.0), bfail=_ok(1.0), nfail=dict(failed="OSError: y"))
+    assert _status(harness.compare(base, new)) == dict(
+        added="new", gone="missing", skip="skipped", bfail="base failed", nfail="FAILED"
+    )
+
+def test_compare_zero_baseline():
+    rows = harness.compare(_res(a=_ok(0.0)), _res(a=_ok(1e-6)))
+    assert rows == [("a", 0.0, 1e-6, None, "zero baseline")]
+
+def test_compare_budget():
+    base = _res(a=_ok(0.001), b=_ok(0.001))
+    new = _res(a=_ok(0.0011, budget=0.001), b=_ok(0.0005, budget=0.001))
+    assert _status(harness.compare(base, new)) == dict(a="OVER BUDGET", b="improved")
+
+def test_format_comparison():
+    rows = [("a", 1e-3, 2e-3, 2.0, "REGRESSION"), ("b", None, 5e-7, None, "new")]
+    lines = harness.format_comparison(rows).splitlines()
+    assert lines[0].split() == ["benchmark","base","new","ratio","status"]
+    assert lines[1].split() == ["a","1.000ms","2.000ms","2.00x","REGRESSION"]
+    assert lines[2].split() == ["b","-","500.0ns","-","new"]
+
+def test_compare_exit_code(tmp_path, capsys):
+    def write(name, results):
+        path = tmp_path/name
+        harness.save(results, path)
+        return str(path)
+    base = write("base.json", dict(a=_ok(1.0)))
+    assert main(["compare", base, write("same.json", dict(a=_ok(1.05)))]) == 0
+    assert main(["compare", base, write("slow.json", dict(a=_ok(2.0)))]) == 1
+    assert main(["compare", base, write("fail.json", dict(a=dict(failed="x")))]) == 1
+    assert "1 benchmark(s) failed" in capsys.readouterr().out
+
+def test_compare_exit_code_budget(tmp_path, capsys):
+    base, new = tmp_path/"base.json", tmp_path/"new.json"
+    harness.save(dict(a=_ok(0.001)), base)
+    harness.save(dict(a=_ok(0.001, budget=0.0005)), new)
+    assert main(["compare", str(base), str(new)]) == 1
+    out = capsys.readouterr().out
+    assert "1 benchmark(s) over budget" in out and "regression" not in out
@@ -0,0 +1,142 @@
+# SPDX-FileCopyRightText: Copyright (c) 2022-present Jeffrey LeBlanc
+# SPDX-License-Indentifier: MIT
+
+import json
+import logging
+
+import pytest
+
+from jutil import instrument
+from jutil.instrument import CallEvent, LatencyHistogram, SlowCallLog
+from jutil.proc import proc, proc0, ProcError
+from jutil.v0.utils.ssh import _rsync_bytes
+
+
+@pytest.fixture
+def events():
+    lst = []
+    instrument.add_hook(lst.append)
+    yield lst
+    instrument.clear_hooks()
+
+
+#-- Recording ------------------------------------------------------#
+
+def test_noop_without_hooks(monkeypatch):
+    instrument.clear_hooks()
+    assert not instrument.enabled()
+    assert instrument.start() is None
+    monkeypatch.setattr(instrument, "CallEvent", lambda *a,**k: pytest.fail("event built without hooks"))
+    instrument.record(None, "proc", "x")
+    instrument.record(0.0, "proc", "x")
+    assert proc(["true"])[0] == 0
+
+def test_proc_events(events, tmp_path):
+    proc(["true"], cwd=tmp_path)
+    proc(["echo","hello"])
+    proc("false")
+    with pytest.raises(FileNotFoundError):
+        proc(["jutil-no-such-binary"])
+    ok,echo,false,missing = events
+    assert (ok.kind,ok.op,ok.target,ok.code,ok.bytes_in,ok.bytes_out,ok.error) == ("proc","true",str(tmp_path),0,0,0,None)
+    assert (echo.op,echo.code,echo.bytes_out) == ("echo",0,len(b"hello\n"))
+    assert (false.op,false.code) == ("false",1)
+    assert missing.op == "jutil-no-such-binary" and missing.code is None
+    assert missing.error.startswith("FileNotFoundError")
+    assert all( e.duration >= 0 for e in events )
+
+def test_proc0_failure_event(events):
+    with pytest.raises(ProcError):
+        proc0(["false"], quiet=True)
+    assert [ (e.op,e.code) for e in events ] == [("false",1)]
+
+def test_traced(events):
+    class Thing:
+        where = "here"
+        @instrument.traced("test", target="where")
+        def ok(self):
+            return 42
+        @instrument.traced("test", op="custom", target="where")
+        def boom(self):
+            raise RuntimeError("nope")
+    t = Thing()
+    assert t.ok() == 42
+    with pytest.raises(RuntimeError):
+        t.boom()
+    ok,boom = events
+    assert (ok.kind,ok.op,ok.target,ok.code,ok.error) == ("test","ok","here",0,None)
+    assert (boom.op,boom.target,boom.code) == ("custom","here",None)
+    assert "RuntimeError" in boom.error
+
+def test_hook_exception_is_caught(events, caplog):
+    def broken(event):
+        raise ValueError("bad hook")
+    instrument.add_hook(broken)
+    later = instrument.add_hook([].append)
+    with caplog.at_level(logging.ERROR):
+        instrument.record(instrument.start(), "proc", "x", code=0)
+    assert len(events) == 1
+    assert "bad hook" in caplog.text
+    instrument.remove_hook(later)
+
+def test_add_hook_is_idempotent(events):
+    instrument.add_hook(events.append)
+    instrument.record(instrument.start(), "proc", "x")
+    assert len(events) == 1
+
+
+#-- Built-in hooks ------------------------------------------------------#
+
+def _ev(duration, op="x", kind="k", **kw):
+    return CallEvent(kind, op, duration=duration, **kw)
+
+def test_histogram_buckets_and_totals():
+    h = LatencyHistogram(buckets=(0.1, 1.0))
+    for d in (0.05, 0.1, 0.5, 1.0, 5.0):
+        h(_ev(d, bytes_in=1, bytes_out=10, code=0))
+    h(_ev(0.2, code=2))
+    h(_ev(0.2, error="boom"))
+    (s,) = h.snapshot()
+    # upper bounds are inclusive
+    assert s["buckets"] == [[0.1,2],[1.0,4],["+Inf",1]]
+    assert (s["count"],s["errors"],s["bytes_in"],s["bytes_out"],s["max"]) == (7,2,5,50,5.0)
+    assert s["sum"] == pytest.approx(7.05)
+    assert json.loads(h.dump_json()) == h.snapshot()
+    h.reset()
+    assert h.snapshot() == []
+
+def test_histogram_prometheus():
+    h = LatencyHistogram(buckets=(0.1, 1.0))
+    h(_ev(0.05, op='we"ird\\op\n', code=0, bytes_out=3))
+    h(_ev(0.5, op='we"ird\\op\n', code=1))
+    text = h.dump_prometheus(prefix="t")
+    labels = 'kind="k",op="we\\"ird\\\\op\\n"'
+    assert f't_duration_seconds_bucket{{{labels},le="0.1"}} 1' in text
+    assert f't_duration_seconds_bucket{{{labels},le="1.0"}} 2' in text
+    assert f't_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in text
+    assert f't_duration_seconds_count{{{labels}}} 2' in text
+    assert f't_errors_total{{{labels}}} 1' in text
+    assert f't_bytes_out_total{{{labels}}} 3' in text
+    assert "# TYPE t_duration_seconds histogram" in text
+    assert text.endswith("\n")
+
+def test_slow_call_log(caplog):
+    log = SlowCallLog(threshold=1.0, maxlen=2, logger=logging.getLogger("jutil.test"))
+    with caplog.at_level(logging.WARNING):
+        for d in (0.5, 1.0, 2.0, 3.0):
+            log(_ev(d, op=f"op{d}", target="host"))
+    assert [ e.duration for e in log.entries ] == [2.0, 3.0]
+    assert caplog.text.count("slow call") == 3
+    assert [ e["op"] for e in json.loads(log.dump_json()) ] == ["op2.0","op3.0"]
+
+
+#-- rsync stats ------------------------------------------------------#
+
+@pytest.mark.parametrize("out,expected", [
+    ("sent 1,234 bytes  received 56 bytes  2,580.00 bytes/sec\ntotal size is 9", (1234,56)),
+    ("sent 1.234.567 bytes  received 89 bytes", (1234567,89)),
+    ("sent 0 bytes  received 0 bytes", (0,0)),
+    ("nothing useful", (None,None)),
+])
+def test_rsync_bytes(out, expected):
+    assert _rsync_bytes(out) == expected
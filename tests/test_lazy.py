@@ -0,0 +1,28 @@
+# SPDX-FileCopyRightText: Copyright (c) 2022-present Jeffrey LeBlanc
+# SPDX-License-Indentifier: MIT
+
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+def _run(code):
+    r = subprocess.run([sys.executable,"-c",code], capture_output=True, text=True, cwd=REPO_ROOT)
+    assert r.returncode == 0, r.stderr
+    return r.stdout
+
+def test_import_jutil_is_light():
+    out = _run("import sys, jutil; print(sorted(m for m in sys.modules if m.startswith('jutil')))")
+    assert out.strip() == "['jutil', 'jutil.__version__']"
+
+def test_missing_optional_dependency_is_import_error():
+    code = (
+        "import sys; sys.modules['paramiko'] = None\n"
+        "import jutil, jutil.sshconn\n"
+        "try:\n"
+        "    jutil.sshconn.SSHConn('localhost').connect()\n"
+        "except ImportError as err:\n"
+        "    print(type(err).__name__, 'paramiko' in str(err))\n"
+    )
+    assert _run(code).split() == ["MissingDependency","True"]
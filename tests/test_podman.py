@@ -0,0 +1,127 @@
+# SPDX-FileCopyRightText: Copyright (c) 2022-present Jeffrey LeBlanc
+# SPDX-License-Indentifier: MIT
+
+import json
+
+import pytest
+
+from bench.standins import fake_container, fake_podman
+from jutil import podman
+from jutil.proc import ProcError
+from jutil.podman import (
+    ContainerReport, _iter_json_array, _iter_ps_entries, podman_ps, podman_start, podman_stop, podman_rm
+)
+
+# fake_podman(count=12, match_every=2): bench-00000,02,...,10 match, every 3rd is exited
+MATCHING = [ f"bench-{i:05d}" for i in range(0,12,2) ]
+ON = [ f"bench-{i:05d}" for i in range(0,12,2) if i % 3 != 0 ]
+OFF = [ f"bench-{i:05d}" for i in range(0,12,2) if i % 3 == 0 ]
+
+
+def _calls(log, op):
+    return [ line.split() for line in log.read_text().splitlines() if line.split()[0] == op ]
+
+
+#-- JSON array scanning ------------------------------------------------------#
+
+@pytest.mark.parametrize("text,expected", [
+    ("[]", []),
+    (" [ ]\n", []),
+    ('[{"a":1}]', [{"a":1}]),
+    ('[ {"a":1} ,\n {"b":[1,2]} ]\n', [{"a":1},{"b":[1,2]}]),
+])
+def test_iter_json_array(text, expected):
+    assert list(_iter_json_array(text)) == expected
+
+@pytest.mark.parametrize("text", ["", "   ", '{"a":1}', '[{"a":1} {"b":2}]', '[{"a":1},', '[{"a":1}'])
+def test_iter_json_array_malformed(text):
+    with pytest.raises(ValueError):
+        list(_iter_json_array(text))
+
+
+@pytest.mark.parametrize("indent", [4, 2, None])
+def test_iter_ps_entries_matches_full_decode(indent):
+    containers = [ fake_container(i) for i in range(7) ]
+    containers[3]["Names"] = ['we\\ird "name"']
+    # A nested key that must not be mistaken for the container's own fields
+    containers[4]["Labels"]["x"] = {"Names": ["nested"], "Exited": True}
+    text = json.dumps(containers, indent=indent)
+    entries = list(_iter_ps_entries(text))
+    assert [ (n,on) for n,on,_,_ in entries ] == [ (c["Names"][0],not c["Exited"]) for c in containers ]
+    assert [ obj if raw is None else json.loads(raw) for _,_,obj,raw in entries ] == containers
+    # Only pretty printed output is split without decoding
+    assert all( (raw is None) == (indent is None) for _,_,_,raw in entries )
+
+
+#-- podman_ps ------------------------------------------------------#
+
+def test_ps_obj_is_decoded_lazily_and_once(tmp_path, monkeypatch):
+    with fake_podman(tmp_path, count=12):
+        containers = podman_ps(prefix="bench-")
+    calls = []
+    loads = podman.json.loads
+    monkeypatch.setattr(podman.json, "loads", lambda s,*a,**k: calls.append(s) or loads(s,*a,**k))
+    c = containers[0]
+    assert c._obj is None and c._raw is not None
+    assert c.obj["Names"] == [c.name]
+    assert c.obj is c.obj
+    assert len(calls) == 1 and c._raw is None
+
+def test_ps_prefix_filters_server_and_client_side(tmp_path):
+    with fake_podman(tmp_path, count=12) as log:
+        containers = podman_ps(prefix="bench-")
+    assert [ c.name for c in containers ] == MATCHING
+    assert [ c.name for c in containers if c.on ] == ON
+    assert all( isinstance(c, ContainerReport) and c.obj["Names"] == [c.name] for c in containers )
+    assert _calls(log,"ps") == [["ps","--format=json","--all","--filter=name=^bench\\-"]]
+
+def test_ps_all(tmp_path):
+    with fake_podman(tmp_path, count=12):
+        assert len(podman_ps()) == 12
+        assert len(podman_ps(raw=True)) == 12
+
+def test_ps_failure_raises(tmp_path, capsys):
+    with fake_podman(tmp_path, count=12, fail_ps=True):
+        with pytest.raises(ProcError) as err:
+            podman_ps(prefix="bench-")
+        assert "unable to connect" in err.value.cmd_stderr
+        with pytest.raises(ProcError):
+            podman_stop("bench-")
+    # Library code reports through the exception, not stdout
+    assert capsys.readouterr().out == ""
+
+
+#-- Bulk operations ------------------------------------------------------#
+
+def test_stop_only_running_matches(tmp_path):
+    with fake_podman(tmp_path, count=12) as log:
+        results = podman_stop("bench-", parallel=3, timeout=5)
+    assert list(results) == ON
+    assert all( results[n] == (0,f"{n}\n","") for n in ON )
+    assert sorted( c[-1] for c in _calls(log,"stop") ) == ON
+    assert all( c[1] == "--time=5" for c in _calls(log,"stop") )
+
+def test_start_only_stopped_matches(tmp_path):
+    with fake_podman(tmp_path, count=12) as log:
+        results = podman_start("bench-", parallel=1)
+    assert list(results) == OFF
+    assert sorted( c[-1] for c in _calls(log,"start") ) == OFF
+
+def test_rm_force_and_per_container_failures(tmp_path):
+    failing = MATCHING[1]
+    with fake_podman(tmp_path, count=12, fail_names=[failing]) as log:
+        results = podman_rm("bench-", force=True)
+        assert list(results) == MATCHING
+        assert all( c[1] == "--force" for c in _calls(log,"rm") )
+        assert results[failing][0] == 125 and failing in results[failing][2]
+        assert all( results[n][0] == 0 for n in MATCHING if n != failing )
+
+def test_rm_without_force_skips_running(tmp_path):
+    with fake_podman(tmp_path, count=12) as log:
+        assert list(podman_rm("bench-")) == OFF
+    assert all( len(c) == 2 for c in _calls(log,"rm") )
+
+def test_bulk_requires_prefix():
+    for fn in (podman_start, podman_stop, podman_rm):
+        with pytest.raises(ValueError):
+            fn("")